@@ -4,7 +4,7 @@ steam-community-market
 A synchronous Python read-only wrapper for the Steam Community Market API.
 """
 from .currencies import Currency, LegacyCurrency
-from .decorators import sanitized, typechecked
+from .decorators import sanitized, typechecked, validated
 from .enums import AppID, Language
 from .exceptions import (
     InvalidItemOrAppIDException,
@@ -24,6 +24,7 @@ __all__ = [
     # Decorators
     "sanitized",
     "typechecked",
+    "validated",
     # Enums
     "AppID",
     "Language",
@@ -6,24 +6,36 @@ from .exceptions import (
     LegacyCurrencyException,
 )
 
-from functools import wraps
-from inspect import signature
+from collections import abc
+from functools import lru_cache, wraps
+from inspect import iscoroutinefunction, signature
 from itertools import repeat
 from typing import Any, Callable, Iterator, Union, get_args, get_origin
 
+_CURRENCY_MAP = Currency._value2member_map_
+_LEGACY_CURRENCY_MAP = LegacyCurrency._value2member_map_
+
 
 def _sanitize_app_id_value(
     value: Union[AppID, int, list[Union[AppID, int]]], args_dict: dict[str, Any]
-) -> Union[int, Iterator[int]]:
-    market_hash_names = args_dict.get("market_hash_names")
+) -> Union[int, Iterator[int], list[int]]:
     if isinstance(value, list):
-        return (int(item) for item in value)
-    elif market_hash_names is not None:
-        return repeat(int(value), len(market_hash_names))
+        if all(type(item) is int for item in value):
+            return value
 
-    return int(value)
+        return [int(item) for item in value]
 
+    if type(value) is not int:
+        value = int(value)
 
+    market_hash_names = args_dict.get("market_hash_names")
+    if market_hash_names is not None:
+        return repeat(value, len(market_hash_names))
+
+    return value
+
+
+@lru_cache(maxsize=128, typed=True)
 def _sanitize_currency_value(
     value: Union[Currency, LegacyCurrency, int, str]
 ) -> Currency:
@@ -44,18 +56,19 @@ def _sanitize_currency_value(
         return currency
 
     if isinstance(value, int):
-        if value in LegacyCurrency:
-            legacy_currency = LegacyCurrency(value)
+        if (legacy_currency := _LEGACY_CURRENCY_MAP.get(value)) is not None:
             raise LegacyCurrencyException(legacy_currency)
 
-        try:
-            value = Currency(value)
-        except KeyError as e:
-            raise InvalidCurrencyException(value) from e
+        currency = _CURRENCY_MAP.get(value)
+        if currency is None:
+            raise InvalidCurrencyException(value)
+
+        return currency
 
     return value
 
 
+@lru_cache(maxsize=128, typed=True)
 def _sanitize_language_value(value: Union[Language, str]) -> Language:
     if isinstance(value, Language):
         return value
@@ -73,20 +86,16 @@ def _sanitize_market_items_dict_value(
     return {int(app_id): list(items) for app_id, items in value.items()}
 
 
-def _sanitize_market_hash_name_value(value: str) -> str:
-    return value.replace("/", "-")
-
-
 def _sanitize_market_hash_names_value(
     value: list[str], args_dict: dict[str, Any]
-) -> Iterator[str]:
+) -> list[str]:
     app_id = args_dict.get("app_id")
     if isinstance(app_id, list) and len(app_id) != len(value):
         raise ValueError(
             f"Number of market hash names ({len(value)}) must match number of app IDs ({len(app_id)})."
         )
 
-    return (_sanitize_market_hash_name_value(item) for item in value)
+    return [item.replace("/", "-") for item in value]
 
 
 def _sanitize_price_type_value(value: Union[str, tuple[str, ...]]) -> tuple[str, ...]:
@@ -112,7 +121,7 @@ _SANITIZE_FUNCS = {
     "currency": lambda value, _: _sanitize_currency_value(value),
     "market_items_dict": lambda value, _: _sanitize_market_items_dict_value(value),
     "language": lambda value, _: _sanitize_language_value(value),
-    "market_hash_name": lambda value, _: _sanitize_market_hash_name_value(value),
+    "market_hash_name": lambda value, _: value.replace("/", "-"),
     "market_hash_names": lambda value, args_dict: _sanitize_market_hash_names_value(
         value, args_dict
     ),
@@ -120,55 +129,98 @@ _SANITIZE_FUNCS = {
 }
 
 
-def _sanitize_value(param_name: str, value: Any, args_dict: dict[str, Any]) -> Any:
-    sanitize_func = _SANITIZE_FUNCS.get(param_name)
-    return value if sanitize_func is None else sanitize_func(value, args_dict)
+def _compile_callable_typecheck(
+    expected_type_args: tuple[Any, ...]
+) -> Callable[[Any], bool]:
+    return callable
 
 
-def _typecheck_dict_value(value: dict, expected_type_args: tuple[Any, ...]) -> bool:
-    return all(
-        _typecheck_value(k, expected_type_args[0])
-        and _typecheck_value(v, expected_type_args[1])
-        for k, v in value.items()
+def _compile_dict_typecheck(
+    expected_type_args: tuple[Any, ...]
+) -> Callable[[Any], bool]:
+    key_check = _compile_typecheck(expected_type_args[0])
+    value_check = _compile_typecheck(expected_type_args[1])
+    return lambda value: isinstance(value, dict) and all(
+        key_check(k) and value_check(v) for k, v in value.items()
     )
 
 
-def _typecheck_list_value(value: list, expected_type_args: tuple[Any, ...]) -> bool:
-    return all(_typecheck_value(x, expected_type_args[0]) for x in value)
+def _compile_list_typecheck(
+    expected_type_args: tuple[Any, ...]
+) -> Callable[[Any], bool]:
+    item_check = _compile_typecheck(expected_type_args[0])
+    return lambda value: isinstance(value, list) and all(item_check(x) for x in value)
 
 
-def _typecheck_set_value(value: set, expected_type_args: tuple[Any, ...]) -> bool:
-    return all(_typecheck_value(x, expected_type_args[0]) for x in value)
+def _compile_set_typecheck(
+    expected_type_args: tuple[Any, ...]
+) -> Callable[[Any], bool]:
+    item_check = _compile_typecheck(expected_type_args[0])
+    return lambda value: isinstance(value, set) and all(item_check(x) for x in value)
 
 
-def _typecheck_tuple_value(
-    value: tuple[Any, ...], expected_type_args: tuple[Any, ...]
-) -> bool:
-    return all(_typecheck_value(x, t) for x, t in zip(value, expected_type_args))
+def _compile_tuple_typecheck(
+    expected_type_args: tuple[Any, ...]
+) -> Callable[[Any], bool]:
+    if len(expected_type_args) == 2 and expected_type_args[1] is Ellipsis:
+        item_check = _compile_typecheck(expected_type_args[0])
+        return lambda value: isinstance(value, tuple) and all(
+            item_check(x) for x in value
+        )
 
+    item_checks = tuple(_compile_typecheck(arg) for arg in expected_type_args)
+    return (
+        lambda value: isinstance(value, tuple)
+        and len(value) == len(item_checks)
+        and all(check(x) for check, x in zip(item_checks, value))
+    )
 
-_TYPECHECK_FUNCS = {
-    dict: _typecheck_dict_value,
-    list: _typecheck_list_value,
-    set: _typecheck_set_value,
-    tuple: _typecheck_tuple_value,
-}
 
+def _compile_union_typecheck(
+    expected_type_args: tuple[Any, ...]
+) -> Callable[[Any], bool]:
+    concrete_types = tuple(arg for arg in expected_type_args if get_origin(arg) is None)
+    generic_checks = tuple(
+        _compile_typecheck(arg)
+        for arg in expected_type_args
+        if get_origin(arg) is not None
+    )
+    if not generic_checks:
+        return lambda value: isinstance(value, concrete_types)
 
-def _typecheck_value(value: Any, expected_type: Any) -> bool:
+    return lambda value: isinstance(value, concrete_types) or any(
+        check(value) for check in generic_checks
+    )
+
+
+def _compile_typecheck(expected_type: Any) -> Callable[[Any], bool]:
     origin = get_origin(expected_type)
     args = get_args(expected_type)
 
     if origin is None:
-        return isinstance(value, expected_type)
+        return lambda value: isinstance(value, expected_type)
 
     if origin is Union:
-        return any(_typecheck_value(value, arg) for arg in args)
+        return _compile_union_typecheck(args)
+
+    if origin is list:
+        return _compile_list_typecheck(args)
+    elif origin is dict:
+        return _compile_dict_typecheck(args)
+    elif origin is tuple:
+        return _compile_tuple_typecheck(args)
+    elif origin is set:
+        return _compile_set_typecheck(args)
+    elif origin is abc.Callable:
+        return _compile_callable_typecheck(args)
 
-    if check_func := _TYPECHECK_FUNCS.get(origin):
-        return check_func(value, args)
+    return lambda _: False
 
-    return False
+
+def _invalid_type_error(arg_name: str, expected_type: Any, value: Any) -> TypeError:
+    return TypeError(
+        f"Expected argument '{arg_name}' to be of type '{expected_type}', not '{type(value).__name__}'."
+    )
 
 
 def sanitized(func: Callable[..., Any]) -> Callable[..., Any]:
@@ -187,22 +239,32 @@ def sanitized(func: Callable[..., Any]) -> Callable[..., Any]:
         The decorator function.
     """
 
+    param_names = tuple(signature(func).parameters)
+    positional_plan = tuple(
+        (i, name, _SANITIZE_FUNCS[name])
+        for i, name in enumerate(param_names)
+        if name in _SANITIZE_FUNCS
+    )
+    kwarg_plan = {
+        name: _SANITIZE_FUNCS[name] for name in param_names if name in _SANITIZE_FUNCS
+    }
+
     @wraps(func)
     def wrapper(*args, **kwargs):
-        sig = signature(func)
-        param_names = list(sig.parameters.keys())
-        sanitize_param_names = list(_SANITIZE_FUNCS.keys())
+        if positional_plan and positional_plan[0][0] < len(args):
+            args = list(args)
+            args_dict = dict(zip(param_names, args))
+            for i, name, sanitize_func in positional_plan:
+                if i >= len(args):
+                    break
 
-        args_dict = dict(zip(param_names, args))
-        for arg_name, arg in args_dict.items():
-            if arg_name in sanitize_param_names:
-                args_dict[arg_name] = _sanitize_value(arg_name, arg, args_dict)
+                args[i] = args_dict[name] = sanitize_func(args[i], args_dict)
 
-        for kwarg_name, kwarg_value in kwargs.items():
-            if kwarg_name in sanitize_param_names:
-                kwargs[kwarg_name] = _sanitize_value(kwarg_name, kwarg_value, kwargs)
+        for name, sanitize_func in kwarg_plan.items():
+            if name in kwargs:
+                kwargs[name] = sanitize_func(kwargs[name], kwargs)
 
-        return func(*tuple(args_dict.values()), **kwargs)
+        return func(*args, **kwargs)
 
     return wrapper
 
@@ -223,29 +285,115 @@ def typechecked(func: Callable[..., Any]) -> Callable[..., Any]:
         The decorated function.
     """
 
+    annotations = func.__annotations__
+    param_names = tuple(signature(func).parameters)
+    kwarg_typechecks = {
+        name: (annotations[name], _compile_typecheck(annotations[name]))
+        for name in param_names
+        if name in annotations
+    }
+    positional_typechecks = tuple(
+        (i, name, *kwarg_typechecks[name])
+        for i, name in enumerate(param_names)
+        if name in kwarg_typechecks
+    )
+
     @wraps(func)
     def wrapper(*args, **kwargs):
-        annotations = func.__annotations__
-        sig = signature(func)
-        param_names = list(sig.parameters.keys())
-
-        for i, arg in enumerate(args):
-            arg_name = param_names[i]
-            if arg_name in annotations and not _typecheck_value(
-                arg, annotations[arg_name]
-            ):
-                raise TypeError(
-                    f"Expected argument '{arg_name}' to be of type '{annotations[arg_name]}', not '{type(arg).__name__}'."
-                )
+        for i, arg_name, expected_type, typecheck in positional_typechecks:
+            if i < len(args) and not typecheck(args[i]):
+                raise _invalid_type_error(arg_name, expected_type, args[i])
 
         for kwarg_name, kwarg_value in kwargs.items():
-            if kwarg_name in annotations and not _typecheck_value(
-                kwarg_value, annotations[kwarg_name]
+            if kwarg_name in kwarg_typechecks and not kwarg_typechecks[kwarg_name][1](
+                kwarg_value
             ):
-                raise TypeError(
-                    f"Expected argument '{kwarg_name}' to be of type '{annotations[kwarg_name]}', not '{type(kwarg_value).__name__}'."
+                raise _invalid_type_error(
+                    kwarg_name, kwarg_typechecks[kwarg_name][0], kwarg_value
                 )
 
         return func(*args, **kwargs)
 
     return wrapper
+
+
+def validated(func: Callable[..., Any]) -> Callable[..., Any]:
+    """Decorator to typecheck and then sanitize arguments before passing them to a function.
+
+    Equivalent to stacking :func:`typechecked` on top of :func:`sanitized`, but driven by a single plan built at decoration time. \
+        Every argument is typechecked before any of them is sanitized. Coroutine functions are wrapped in a coroutine function, so \
+        validation errors are raised when the result is awaited.
+
+    .. versionadded:: 1.3.0
+
+    Parameters
+    ----------
+    func : Callable[..., Any]
+        The function to decorate.
+
+    Returns
+    -------
+    Callable[..., Any]
+        The decorated function.
+    """
+
+    annotations = func.__annotations__
+    param_names = tuple(signature(func).parameters)
+    kwarg_plan = {
+        name: (
+            annotations.get(name),
+            _compile_typecheck(annotations[name]) if name in annotations else None,
+            _SANITIZE_FUNCS.get(name),
+        )
+        for name in param_names
+        if name in annotations or name in _SANITIZE_FUNCS
+    }
+    positional_plan = tuple(
+        (i, name, *kwarg_plan[name])
+        for i, name in enumerate(param_names)
+        if name in kwarg_plan
+    )
+
+    def validate(
+        args: tuple[Any, ...], kwargs: dict[str, Any]
+    ) -> Union[tuple[Any, ...], list[Any]]:
+        for i, name, expected_type, typecheck, _ in positional_plan:
+            if i >= len(args):
+                break
+
+            if typecheck is not None and not typecheck(args[i]):
+                raise _invalid_type_error(name, expected_type, args[i])
+
+        for name, (expected_type, typecheck, _) in kwarg_plan.items():
+            if name in kwargs and typecheck is not None and not typecheck(kwargs[name]):
+                raise _invalid_type_error(name, expected_type, kwargs[name])
+
+        if positional_plan and positional_plan[0][0] < len(args):
+            args = list(args)
+            args_dict = dict(zip(param_names, args))
+            for i, name, _, _, sanitize_func in positional_plan:
+                if i >= len(args):
+                    break
+
+                if sanitize_func is not None:
+                    args[i] = args_dict[name] = sanitize_func(args[i], args_dict)
+
+        for name, (_, _, sanitize_func) in kwarg_plan.items():
+            if name in kwargs and sanitize_func is not None:
+                kwargs[name] = sanitize_func(kwargs[name], kwargs)
+
+        return args
+
+    if iscoroutinefunction(func):
+
+        @wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            return await func(*validate(args, kwargs), **kwargs)
+
+        return async_wrapper
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        return func(*validate(args, kwargs), **kwargs)
+
+    return wrapper
@@ -1,5 +1,5 @@
 from ..currencies import Currency, LegacyCurrency
-from ..decorators import sanitized, typechecked
+from ..decorators import validated
 from ..enums import Language
 
 from .price_overview import PriceOverview
@@ -39,8 +39,9 @@ class Market(PriceOverview):
         Raised when any of the parameters are of the wrong type.
     """
 
-    @typechecked
-    @sanitized
+    __slots__ = ()
+
+    @validated
     def __init__(
         self,
         currency: Union[Currency, LegacyCurrency, int, str] = Currency.USD,
@@ -1,12 +1,23 @@
 from ..currencies import Currency, LegacyCurrency
-from ..decorators import sanitized, typechecked
+from ..decorators import validated
 from ..enums import AppID
-from ..requests import _request_overview, exponential_backoff_strategy
-
+from ..requests import (
+    _request_overview,
+    _request_overviews,
+    _request_overviews_async,
+    exponential_backoff_strategy,
+)
+
+from functools import lru_cache
+from itertools import repeat
 from typing import Callable, Optional, Union
 
 import re
 
+_PRICE_PATTERN = re.compile(r"(\d{1,3}(?:[.,]\d{3})*)(?:[.,](\d{2}))?")
+_PRICE_OVERVIEW_KEYS = frozenset(("lowest_price", "median_price"))
+_CONVERTIBLE_OVERVIEW_KEYS = _PRICE_OVERVIEW_KEYS | {"volume"}
+
 
 class PriceOverview:
     """A class representing the cumulus of functionalities that are using the ``/market/priceoverview`` endpoint of the Steam Community Market API.
@@ -16,6 +27,8 @@ class PriceOverview:
     This class is abstract and should not be instantiated directly, use :class:`Market <steam_community_market.market.instance.Market>` instead.
     """
 
+    __slots__ = ("currency", "__weakref__")
+
     def __init__(self, currency: Currency):
         self.currency = currency
 
@@ -27,8 +40,7 @@ class PriceOverview:
 
         return super().__new__(cls)
 
-    @typechecked
-    @sanitized
+    @validated
     def get_overview(
         self,
         app_id: Union[AppID, int],
@@ -67,15 +79,14 @@ class PriceOverview:
         """
 
         overview = _request_overview(
-            app_id, market_hash_name, currency or self.currency  # type: ignore
+            app_id, market_hash_name, self._resolve_currency(currency)  # type: ignore
         )
         if type_conversion:
             overview = self._overview_type_converter(overview)
 
         return overview
 
-    @typechecked
-    @sanitized
+    @validated
     def get_overviews(
         self,
         app_id: Union[AppID, int, list[Union[AppID, int]]],
@@ -83,6 +94,7 @@ class PriceOverview:
         type_conversion: bool = True,
         currency: Optional[Union[Currency, LegacyCurrency, int, str]] = None,
         rate_limit_handler: Optional[Callable[[int], tuple[bool, float]]] = None,
+        max_workers: int = 8,
     ) -> dict[str, Optional[dict[str, Union[bool, float, int, str]]]]:
         """Gets the prices and volumes of one or more items on the Steam Community Market.
         
@@ -103,15 +115,17 @@ class PriceOverview:
             A function that handles the rate limit. It should take one parameter, the number of seconds to wait, and return a tuple containing a \
             :obj:`bool` indicating whether the request should be retried and the number of seconds to wait. Defaults to \
             :func:`exponential_backoff_strategy <steam_community_market.requests.exponential_backoff_strategy>`.
+        max_workers : int
+            The maximum number of requests to send concurrently. Defaults to 8.
 
         Raises
         ------
-        IndexError
-            Raised when ``app_id`` and ``market_hash_names`` have different lengths.
         TooManyRequestsException
             Raised when the request limit has been reached, after reaching the max retry limit, if any. Default retry limit is 5.
         TypeError
             Raised when any of the parameters are of the wrong type.
+        ValueError
+            Raised when ``app_id`` and ``market_hash_names`` have different lengths, or when ``max_workers`` is less than or equal to 0.
 
         Returns
         -------
@@ -119,30 +133,29 @@ class PriceOverview:
             An overview of each item. Overview includes both volume and prices.
         """
 
+        overviews = _request_overviews(
+            app_id,  # type: ignore
+            market_hash_names,
+            self._resolve_currency(currency),  # type: ignore
+            rate_limit_handler or exponential_backoff_strategy,
+            max_workers,
+        )
+
         return {
             market_hash_name: (
                 self._overview_type_converter(overview) if type_conversion else overview
             )
-            for id, market_hash_name in zip(app_id, market_hash_names)  # type: ignore
-            for overview in [
-                _request_overview(
-                    id,
-                    market_hash_name,
-                    currency or self.currency,  # type: ignore
-                    False,
-                    rate_limit_handler or exponential_backoff_strategy,
-                )
-            ]
+            for market_hash_name, overview in zip(market_hash_names, overviews)
         }
 
-    @typechecked
-    @sanitized
+    @validated
     def get_overviews_from_dict(
         self,
         market_items_dict: dict[Union[AppID, int], list[str]],
         type_conversion: bool = True,
         currency: Optional[Union[Currency, LegacyCurrency, int, str]] = None,
         rate_limit_handler: Optional[Callable[[int], tuple[bool, float]]] = None,
+        max_workers: int = 8,
     ) -> dict[str, dict[str, Union[bool, float, int, str]]]:
         """Gets the prices and volumes of one or more items on the Steam Community Market from a dictionary.
         
@@ -161,6 +174,8 @@ class PriceOverview:
             A function that handles the rate limit. It should take one parameter, the number of seconds to wait, and return a tuple containing a \
             :obj:`bool` indicating whether the request should be retried and the number of seconds to wait. Defaults to \
             :func:`exponential_backoff_strategy <steam_community_market.requests.exponential_backoff_strategy>`.
+        max_workers : int
+            The maximum number of requests to send concurrently. Defaults to 8.
 
         Raises
         ------
@@ -168,6 +183,8 @@ class PriceOverview:
             Raised when the request limit has been reached, after reaching the max retry limit, if any. Default retry limit is 5.
         TypeError
             Raised when any of the parameters are of the wrong type.
+        ValueError
+            Raised when ``max_workers`` is less than or equal to 0.
             
         Returns
         -------
@@ -175,25 +192,92 @@ class PriceOverview:
             An overview of each item. Overview includes both volume and prices.
         """
 
+        app_ids, market_hash_names = self._flatten_market_items_dict(
+            market_items_dict  # type: ignore
+        )
+        overviews = _request_overviews(
+            app_ids,
+            market_hash_names,
+            self._resolve_currency(currency),  # type: ignore
+            rate_limit_handler or exponential_backoff_strategy,
+            max_workers,
+        )
+
         return {
             market_hash_name: (
                 self._overview_type_converter(overview) if type_conversion else overview
             )
-            for app_id, market_hash_names in market_items_dict.items()
-            for market_hash_name in market_hash_names
-            for overview in [
-                _request_overview(
-                    app_id,
-                    market_hash_name,
-                    currency or self.currency,  # type: ignore
-                    False,
-                    rate_limit_handler or exponential_backoff_strategy,
-                )
-            ]
+            for market_hash_name, overview in zip(market_hash_names, overviews)
         }
 
-    @typechecked
-    @sanitized
+    @validated
+    async def get_overviews_async(
+        self,
+        market_items_dict: dict[Union[AppID, int], list[str]],
+        type_conversion: bool = True,
+        currency: Optional[Union[Currency, LegacyCurrency, int, str]] = None,
+        rate_limit_handler: Optional[Callable[[int], tuple[bool, float]]] = None,
+        max_connections: int = 16,
+    ) -> dict[str, dict[str, Union[bool, float, int, str]]]:
+        """Asynchronously gets the prices and volumes of one or more items on the Steam Community Market from a dictionary.
+
+        All requests share a single HTTP session, so connections are kept alive and reused between items. Requires the optional \
+        ``aiohttp`` dependency, installable through ``pip install steam-community-market[async]``.
+
+        .. versionadded:: 1.3.0
+
+        Parameters
+        ----------
+        market_items_dict : dict[AppID or int, list[str]]
+            A dictionary containing the app IDs of the games the items are from as keys and a list of the names of the items; how they appear on the \
+            Steam Community Market as values.
+        type_conversion : bool
+            Whether to convert the returned values to their corresponding types. Defaults to :obj:`True`.
+        currency : Currency or LegacyCurrency or int or str or None
+            Currency used for prices. Defaults to the value imposed by the instance of the class.
+        rate_limit_handler : Callable[[int], tuple[bool, float]] or None
+            A function that handles the rate limit. It should take one parameter, the number of seconds to wait, and return a tuple containing a \
+            :obj:`bool` indicating whether the request should be retried and the number of seconds to wait. Defaults to \
+            :func:`exponential_backoff_strategy <steam_community_market.requests.exponential_backoff_strategy>`.
+        max_connections : int
+            The maximum number of requests to send concurrently. Defaults to 16.
+
+        Raises
+        ------
+        ImportError
+            Raised when ``aiohttp`` is not installed.
+        TooManyRequestsException
+            Raised when the request limit has been reached, after reaching the max retry limit, if any. Default retry limit is 5.
+        TypeError
+            Raised when any of the parameters are of the wrong type.
+        ValueError
+            Raised when ``max_connections`` is less than or equal to 0.
+
+        Returns
+        -------
+        dict[str, dict[str, bool or float or int or str]]
+            An overview of each item. Overview includes both volume and prices.
+        """
+
+        app_ids, market_hash_names = self._flatten_market_items_dict(
+            market_items_dict  # type: ignore
+        )
+        overviews = await _request_overviews_async(
+            app_ids,
+            market_hash_names,
+            self._resolve_currency(currency),  # type: ignore
+            rate_limit_handler or exponential_backoff_strategy,
+            max_connections,
+        )
+
+        return {
+            market_hash_name: (
+                self._overview_type_converter(overview) if type_conversion else overview
+            )
+            for market_hash_name, overview in zip(market_hash_names, overviews)
+        }
+
+    @validated
     def get_price(
         self,
         app_id: Union[AppID, int],
@@ -241,11 +325,10 @@ class PriceOverview:
             market_hash_name,
             (price_type,),
             type_conversion,
-            currency or self.currency,
+            currency,
         )  # type: ignore
 
-    @typechecked
-    @sanitized
+    @validated
     def get_prices(
         self,
         app_id: Union[AppID, int, list[Union[AppID, int]]],
@@ -279,14 +362,13 @@ class PriceOverview:
 
         Raises
         ------
-        IndexError
-            Raised when ``app_id`` and ``market_hash_names`` have different lengths.
         TooManyRequestsException
             Raised when the request limit has been reached, after reaching the max retry limit, if any. Default retry limit is 5.
         TypeError
             Raised when any of the parameters are of the wrong type.
         ValueError
-            Raised when ``price_type`` is not one of ``lowest_price`` or ``median_price`` or both.
+            Raised when ``app_id`` and ``market_hash_names`` have different lengths, or when ``price_type`` is not one of ``lowest_price`` or \
+            ``median_price`` or both.
 
         Returns
         -------
@@ -310,8 +392,7 @@ class PriceOverview:
             ]
         }
 
-    @typechecked
-    @sanitized
+    @validated
     def get_prices_from_dict(
         self,
         market_items_dict: dict[Union[AppID, int], list[str]],
@@ -369,8 +450,7 @@ class PriceOverview:
             for market_hash_name in market_hash_names
         }
 
-    @typechecked
-    @sanitized
+    @validated
     def get_lowest_price(
         self,
         app_id: Union[AppID, int],
@@ -413,11 +493,10 @@ class PriceOverview:
             market_hash_name,
             ("lowest_price",),
             type_conversion,
-            currency or self.currency,
+            currency,
         )  # type: ignore
 
-    @typechecked
-    @sanitized
+    @validated
     def get_lowest_prices(
         self,
         app_id: Union[AppID, int, list[Union[AppID, int]]],
@@ -451,6 +530,8 @@ class PriceOverview:
             Raised when the request limit has been reached, after reaching the max retry limit, if any. Default retry limit is 5.
         TypeError
             Raised when any of the parameters are of the wrong type.
+        ValueError
+            Raised when ``app_id`` and ``market_hash_names`` have different lengths.
             
         Returns
         -------
@@ -474,8 +555,7 @@ class PriceOverview:
             ]
         }
 
-    @typechecked
-    @sanitized
+    @validated
     def get_lowest_prices_from_dict(
         self,
         market_items_dict: dict[Union[AppID, int], list[str]],
@@ -528,8 +608,7 @@ class PriceOverview:
             for market_hash_name in market_hash_names
         }  # type: ignore
 
-    @typechecked
-    @sanitized
+    @validated
     def get_median_price(
         self,
         app_id: Union[AppID, int],
@@ -572,11 +651,10 @@ class PriceOverview:
             market_hash_name,
             ("median_price",),
             type_conversion,
-            currency or self.currency,
+            currency,
         )  # type: ignore
 
-    @typechecked
-    @sanitized
+    @validated
     def get_median_prices(
         self,
         app_id: Union[AppID, int, list[Union[AppID, int]]],
@@ -610,6 +688,8 @@ class PriceOverview:
             Raised when the request limit has been reached, after reaching the max retry limit, if any. Default retry limit is 5.
         TypeError
             Raised when any of the parameters are of the wrong type.
+        ValueError
+            Raised when ``app_id`` and ``market_hash_names`` have different lengths.
             
         Returns
         -------
@@ -633,8 +713,7 @@ class PriceOverview:
             ]
         }
 
-    @typechecked
-    @sanitized
+    @validated
     def get_median_prices_from_dict(
         self,
         market_items_dict: dict[Union[AppID, int], list[str]],
@@ -687,8 +766,7 @@ class PriceOverview:
             for market_hash_name in market_hash_names
         }  # type: ignore
 
-    @typechecked
-    @sanitized
+    @validated
     def get_volume(
         self,
         app_id: Union[AppID, int],
@@ -725,8 +803,7 @@ class PriceOverview:
 
         return self._get_volume(app_id, market_hash_name, type_conversion)
 
-    @typechecked
-    @sanitized
+    @validated
     def get_volumes(
         self,
         app_id: Union[AppID, int, list[Union[AppID, int]]],
@@ -757,6 +834,8 @@ class PriceOverview:
             Raised when the request limit has been reached, after reaching the max retry limit, if any. Default retry limit is 5.
         TypeError
             Raised when any of the parameters are of the wrong type.
+        ValueError
+            Raised when ``app_id`` and ``market_hash_names`` have different lengths.
             
         Returns
         -------
@@ -778,8 +857,7 @@ class PriceOverview:
             ]
         }
 
-    @typechecked
-    @sanitized
+    @validated
     def get_volumes_from_dict(
         self,
         market_items_dict: dict[Union[AppID, int], list[str]],
@@ -827,6 +905,9 @@ class PriceOverview:
             for market_hash_name in market_hash_names
         }
 
+    def _resolve_currency(self, currency: Optional[Currency]) -> Currency:
+        return self.currency if currency is None else currency
+
     def _get_price(
         self,
         app_id: Union[AppID, int],
@@ -840,7 +921,7 @@ class PriceOverview:
         item = _request_overview(
             app_id,
             market_hash_name,
-            currency or self.currency,  # type: ignore
+            self._resolve_currency(currency),  # type: ignore
             raise_exception,
             rate_limit_handler,
         )
@@ -873,35 +954,44 @@ class PriceOverview:
             int(overview["volume"].replace(",", "")) if type_conversion else overview["volume"]  # type: ignore
         )
 
+    @staticmethod
+    def _flatten_market_items_dict(
+        market_items_dict: dict[int, list[str]]
+    ) -> tuple[list[int], list[str]]:
+        app_ids = []
+        market_hash_names = []
+        for app_id, names in market_items_dict.items():
+            app_ids.extend(repeat(app_id, len(names)))
+            market_hash_names.extend(names)
+
+        return (app_ids, market_hash_names)
+
     @staticmethod
     def _overview_type_converter(
         overview: dict, keys_to_convert: Optional[list[str]] = None
     ) -> dict[str, Union[str, int, float]]:
-        valid_keys = ["lowest_price", "median_price", "volume"]
         if keys_to_convert is None:
-            keys_to_convert = valid_keys
-
-        if any(key not in valid_keys for key in keys_to_convert):
+            keys_to_convert = _CONVERTIBLE_OVERVIEW_KEYS
+        elif not _CONVERTIBLE_OVERVIEW_KEYS.issuperset(keys_to_convert):
             raise ValueError(
-                f'Invalid key found in "keys_to_convert". The valid keys are: {", ".join(valid_keys)}.'
+                f'Invalid key found in "keys_to_convert". The valid keys are: {", ".join(sorted(_CONVERTIBLE_OVERVIEW_KEYS))}.'
             )
 
-        result = {}
-        for key, value in overview.items():
-            if key in keys_to_convert and key in ["lowest_price", "median_price"]:
-                result[key] = PriceOverview._price_to_float(value)
-            elif key in keys_to_convert and key == "volume":
-                result[key] = int(value.replace(",", ""))
-            else:
-                result[key] = value
+        result = dict(overview)
+        for key in _PRICE_OVERVIEW_KEYS.intersection(keys_to_convert):
+            if key in result:
+                result[key] = PriceOverview._price_to_float(result[key])
+
+        if "volume" in result and "volume" in keys_to_convert:
+            result["volume"] = int(result["volume"].replace(",", ""))
 
         return result
 
     @staticmethod
+    @lru_cache(maxsize=4096)
     def _price_to_float(value: str) -> Optional[float]:
-        if not (match := re.search(r"(\d{1,3}(?:[.,]\d{3})*)(?:[.,](\d{2}))?", value)):
+        if not (match := _PRICE_PATTERN.search(value)):
             return None
 
-        num_str = match[1].replace(",", "").replace(".", "")
-        decimal_part = match[2] if match[2] is not None else "00"
-        return float(f"{num_str}.{decimal_part}")
+        num_str, decimal_part = match.groups("00")
+        return float(f"{num_str.replace(',', '').replace('.', '')}.{decimal_part}")
@@ -1,13 +1,21 @@
 from .currencies import Currency
 from .exceptions import InvalidItemOrAppIDException, TooManyRequestsException
 
-from typing import Callable, Optional, Union
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
+from typing import Callable, Iterable, Optional, Union
 
+import asyncio
 import contextlib
 import random
 import requests
 import time
 
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
 #: Generic headers to send with each request to the Steam Community Market API.
 REQUEST_HEADERS = {
     "Accept": "*/*",
@@ -50,6 +58,33 @@ def _market_request(
     return (status_code, data)
 
 
+async def _market_request_async(
+    session: "aiohttp.ClientSession",
+    endpoint: str,
+    payload: dict,
+    rate_limit_handler: Optional[Callable[[int], tuple[bool, float]]],
+) -> tuple[int, dict]:
+    url = f"https://steamcommunity.com/market/{endpoint}/"
+
+    retries = 0
+    while True:
+        status_code, data = await _request_async(session, url, payload)
+        if status_code != 429:
+            break
+
+        if rate_limit_handler is None:
+            raise TooManyRequestsException
+
+        retry, sleep_time = rate_limit_handler(retries)
+        if not retry:
+            break
+
+        await asyncio.sleep(sleep_time)
+        retries += 1
+
+    return (status_code, data)
+
+
 def _request(url: str, payload: dict) -> tuple[int, dict]:
     response = requests.get(url, params=payload, headers=REQUEST_HEADERS)
 
@@ -60,6 +95,27 @@ def _request(url: str, payload: dict) -> tuple[int, dict]:
     return (response.status_code, data or {})
 
 
+async def _request_async(
+    session: "aiohttp.ClientSession", url: str, payload: dict
+) -> tuple[int, dict]:
+    async with session.get(url, params=payload, headers=REQUEST_HEADERS) as response:
+        data = None
+        with contextlib.suppress(ValueError):
+            data = await response.json(content_type=None)
+
+        return (response.status, data or {})
+
+
+def _overview_payload(
+    app_id: int, market_hash_name: str, currency: Currency
+) -> dict[str, Union[int, str]]:
+    return {
+        "appid": app_id,
+        "market_hash_name": market_hash_name,
+        "currency": currency.value,
+    }
+
+
 def _request_overview(
     app_id: int,
     market_hash_name: str,
@@ -67,12 +123,7 @@ def _request_overview(
     raise_exception: bool = True,
     rate_limit_handler: Optional[Callable[[int], tuple[bool, float]]] = None,
 ) -> dict[str, Union[bool, str]]:
-    payload = {
-        "appid": app_id,
-        "market_hash_name": market_hash_name,
-        "currency": currency.value,
-    }
-
+    payload = _overview_payload(app_id, market_hash_name, currency)
     status_code, data = _market_request("priceoverview", payload, rate_limit_handler)
     # 500 - Internal Server Error
     if raise_exception and status_code == 500 and data["success"] is False:
@@ -81,6 +132,91 @@ def _request_overview(
     return data
 
 
+def _request_overviews(
+    app_ids: Iterable[int],
+    market_hash_names: Iterable[str],
+    currency: Currency,
+    rate_limit_handler: Optional[Callable[[int], tuple[bool, float]]],
+    max_workers: int,
+) -> list[dict[str, Union[bool, str]]]:
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(
+            executor.map(
+                _request_overview,
+                app_ids,
+                market_hash_names,
+                repeat(currency),
+                repeat(False),
+                repeat(rate_limit_handler),
+            )
+        )
+
+
+async def _request_overview_async(
+    session: "aiohttp.ClientSession",
+    semaphore: asyncio.Semaphore,
+    app_id: int,
+    market_hash_name: str,
+    currency: Currency,
+    raise_exception: bool = True,
+    rate_limit_handler: Optional[Callable[[int], tuple[bool, float]]] = None,
+) -> dict[str, Union[bool, str]]:
+    payload = _overview_payload(app_id, market_hash_name, currency)
+    async with semaphore:
+        status_code, data = await _market_request_async(
+            session, "priceoverview", payload, rate_limit_handler
+        )
+
+    # 500 - Internal Server Error
+    if raise_exception and status_code == 500 and data["success"] is False:
+        raise InvalidItemOrAppIDException(app_id, market_hash_name)
+
+    return data
+
+
+async def _request_overviews_async(
+    app_ids: Iterable[int],
+    market_hash_names: Iterable[str],
+    currency: Currency,
+    rate_limit_handler: Optional[Callable[[int], tuple[bool, float]]],
+    max_connections: int,
+) -> list[dict[str, Union[bool, str]]]:
+    if aiohttp is None:
+        raise ImportError(
+            '"aiohttp" is required for asynchronous requests, install it with "pip install steam-community-market[async]".'
+        )
+
+    if max_connections <= 0:
+        raise ValueError("max_connections must be greater than 0.")
+
+    semaphore = asyncio.Semaphore(max_connections)
+    connector = aiohttp.TCPConnector(limit=max_connections)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        tasks = [
+            asyncio.ensure_future(
+                _request_overview_async(
+                    session,
+                    semaphore,
+                    app_id,
+                    market_hash_name,
+                    currency,
+                    False,
+                    rate_limit_handler,
+                )
+            )
+            for app_id, market_hash_name in zip(app_ids, market_hash_names)
+        ]
+        try:
+            return await asyncio.gather(*tasks)
+        except BaseException:
+            # Cancel the remaining requests before the session gets closed under them.
+            for task in tasks:
+                task.cancel()
+
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+
 def exponential_backoff_strategy(
     retries: int, max_retries: int = 5
 ) -> tuple[bool, float]: